@@ -4,14 +4,189 @@ Maintains single-file architecture with zero bloat
 """
 
 import os
+import re
+import socket
 import json
+import math
+import operator
 import time
+import copy
+import asyncio
 import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
+    HTTPAdapter = None
+    Retry = None
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Longest a Retry-After header may stall a caller, in seconds
+MAX_RETRY_AFTER = 5.0
+
+if HTTPAdapter is not None:
+    # SO_KEEPALIVE (plus idle probe timing where the OS exposes it) keeps pooled
+    # sockets alive through idle NAT/load-balancer timeouts
+    _KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        _KEEPALIVE_SOCKET_OPTIONS += [
+            (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+            (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+            (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        ]
+
+    class KeepAliveHTTPAdapter(HTTPAdapter):
+        """HTTPAdapter whose pooled connections enable TCP keepalive"""
+        
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs.setdefault('socket_options', _KEEPALIVE_SOCKET_OPTIONS)
+            super().init_poolmanager(*args, **kwargs)
+
+    class CappedRetry(Retry):
+        """Retry that honours Retry-After, but never for longer than MAX_RETRY_AFTER"""
+        
+        def get_retry_after(self, response):
+            retry_after = super().get_retry_after(response)
+            return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+def _dumps(obj):
+    """Serialise a response to JSON bytes - orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Raw UTF-8 like orjson, so both backends emit identical bytes
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# Parse raw response bytes directly, skipping the bytes -> str decode step
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Offline arithmetic: the text after "calculate" must be exactly one signed "a OP b"
+_NUMBER = r'([-+]?\d{1,64}(?:\.\d{1,64})?)'
+_EXPRESSION_PATTERN = re.compile(rf'{_NUMBER}\s*([-+*/])\s*{_NUMBER}')
+_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv
+}
+
+# Offline query routing: one scan finds every math keyword present
+_MATH_ROUTE_PATTERN = re.compile(r'derivative|integral|solve|calculate')
+
+def _compile_answer_table(table):
+    """
+    Compile an ordered (pattern, answer) table into one alternation regex
+    The lookahead makes the scan overlapping, so an entry nested inside
+    another match (x^2 within e^x^2) is still seen
+    """
+    pattern = re.compile('(?=(' + '|'.join(re.escape(text) for text, _ in table) + '))')
+    ranked = {text: (rank, answer) for rank, (text, answer) in enumerate(table)}
+    return pattern, ranked
+
+# Error timestamps are second-granular, so bursts reuse one formatted string
+_ISO_CACHE = [None, ""]
+
+def _iso_now():
+    """Current local time as ISO-8601, formatted at most once per second"""
+    second = int(time.time())
+    if second != _ISO_CACHE[0]:
+        _ISO_CACHE[0] = second
+        _ISO_CACHE[1] = datetime.fromtimestamp(second).isoformat()
+    return _ISO_CACHE[1]
+
+class TTLCache:
+    """
+    Bounded LRU cache with per-entry expiry
+    O(1) get/set/evict - memory stays capped at maxsize entries
+    Thread-safe: gather_calls and batch fan-out hit it from worker threads
+    """
+    
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value), oldest first
+        self._lock = threading.Lock()
+        
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+                
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._entries.pop(key, None)
+                return default
+                
+            self._entries.move_to_end(key)
+            return value
+        
+    def __setitem__(self, key, value):
+        with self._lock:
+            entries = self._entries
+            entries[key] = (time.monotonic() + self.ttl, value)
+            entries.move_to_end(key)
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+            
+    def __len__(self):
+        return len(self._entries)
+
+class LRUCache:
+    """
+    Bounded key -> value store - least recently used entries are evicted
+    Wraps an OrderedDict rather than subclassing it, so copies and pickles keep maxsize
+    """
+    
+    __slots__ = ('maxsize', '_entries')
+    
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # oldest first
+        
+    def get(self, key, default=None):
+        entries = self._entries
+        if key not in entries:
+            return default
+        entries.move_to_end(key)
+        return entries[key]
+        
+    def __setitem__(self, key, value):
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            
+    def pop(self, key, default=None):
+        return self._entries.pop(key, default)
+        
+    def __contains__(self, key):
+        return key in self._entries
+        
+    def __len__(self):
+        return len(self._entries)
+        
+    def copy(self):
+        clone = LRUCache(self.maxsize)
+        clone._entries = self._entries.copy()
+        return clone
+        
+    __copy__ = copy
 
 class LightweightAPIManager:
     """
@@ -20,44 +195,106 @@ class LightweightAPIManager:
     """
     
     def __init__(self):
-        self.service_registry = {}
-        self.cache = {}  # Simple in-memory cache
+        self.service_registry = {}  # Instantiated adapters, filled on first use
+        self._dispatch = {}  # service -> (make_call, get_offline_response, uses_network) bound once
         self.cache_ttl = 300  # 5 minutes cache
-        self.offline_mode = False
+        self.cache = TTLCache(maxsize=1024, ttl=self.cache_ttl)
+        self.offline_mode = None  # Unknown until the first network-backed call probes it
+        self.connectivity_ttl = 60  # Re-probe at most once a minute
+        self._connectivity_checked_at = None
+        self._connectivity_lock = threading.Lock()
+        self.breaker_threshold = 5  # Consecutive live failures before the circuit opens
+        self.breaker_cooldown = 30  # Seconds to serve offline answers before a half-open retry
+        self._breakers = {}  # service -> [consecutive_failures, open_until]
         self.api_health = {}
+        self.session = self._create_session()
         
         # Initialize all service adapters
         self._initialize_services()
         
+    def _create_session(self):
+        """Shared keep-alive session so repeated calls reuse pooled connections"""
+        if requests is None:
+            return None
+            
+        session = requests.Session()
+        
+        # Transient 429/5xx blips are retried with backoff, honouring a capped Retry-After;
+        # connect/read timeouts fail fast so the circuit breaker sees them
+        retry = CappedRetry(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True
+        )
+        # Sized for gather/batch fan-out; pool_block=False opens overflow connections instead of waiting
+        pool = KeepAliveHTTPAdapter(pool_connections=32, pool_maxsize=32, pool_block=False, max_retries=retry)
+        session.mount('https://', pool)
+        session.mount('http://', pool)
+        # Close the pools when the manager is collected (or at exit) without pinning it alive
+        weakref.finalize(self, session.close)
+        return session
+
     def _initialize_services(self):
-        """Initialize all API service adapters - lightweight only"""
-        self.service_registry = {
+        """Register all API service adapters - instantiated lazily on first use"""
+        self.service_factories = {
             # Mathematics & Computation
-            'wolfram_alpha': WolframAlphaAdapter(),
-            'math_computation': MathComputationAdapter(),
+            'wolfram_alpha': WolframAlphaAdapter,
+            'math_computation': MathComputationAdapter,
             
             # Calendar & Productivity
-            'calendar_simulator': CalendarAdapter(),
-            'task_simulator': TaskAdapter(),
+            'calendar_simulator': CalendarAdapter,
+            'task_simulator': TaskAdapter,
             
             # Data & Analytics
-            'data_analysis': DataAnalysisAdapter(),
+            'data_analysis': DataAnalysisAdapter,
             
             # Accounting & Finance
-            'accounting_simulator': AccountingAdapter(),
+            'accounting_simulator': AccountingAdapter,
             
             # Agriculture
-            'agriculture_simulator': AgricultureAdapter(),
+            'agriculture_simulator': AgricultureAdapter,
             
             # Project Management
-            'project_simulator': ProjectManagementAdapter(),
+            'project_simulator': ProjectManagementAdapter,
             
             # Relationship Intelligence
-            'relationship_analyzer': RelationshipAdapter()
+            'relationship_analyzer': RelationshipAdapter
         }
-        
-        # Check if we have basic internet connectivity
-        self._check_connectivity()
+
+    def _get_adapter(self, service_name):
+        """Return the service adapter, building it on first use (None if unknown)"""
+        adapter = self.service_registry.get(service_name)
+        if adapter is None:
+            factory = self.service_factories.get(service_name)
+            if factory is None:
+                return None
+            adapter = self.service_registry[service_name] = factory(self.session)
+            self._dispatch[service_name] = (adapter.make_call, adapter.get_offline_response, adapter.uses_network())
+        return adapter
+
+    def _uses_network(self, service_name):
+        """True when the service's live path actually leaves the process"""
+        return self._get_adapter(service_name) is not None and self._dispatch[service_name][2]
+
+    def _ensure_connectivity(self):
+        """
+        Probe connectivity lazily instead of blocking __init__, cached for connectivity_ttl
+        Concurrent callers wait for an in-flight probe rather than reading its unknown result
+        """
+        checked_at = self._connectivity_checked_at
+        if checked_at is not None and time.monotonic() - checked_at < self.connectivity_ttl:
+            return self.offline_mode
+            
+        with self._connectivity_lock:
+            checked_at = self._connectivity_checked_at
+            if checked_at is None or time.monotonic() - checked_at >= self.connectivity_ttl:
+                self._check_connectivity()
+                self._connectivity_checked_at = time.monotonic()
+        return self.offline_mode
 
     def _check_connectivity(self):
         """Lightweight connectivity check"""
@@ -66,7 +303,8 @@ class LightweightAPIManager:
             return
             
         try:
-            # Ultra-fast check without heavy dependencies
+            # Ultra-fast check without heavy dependencies - deliberately outside the
+            # retrying session so an unreachable network costs one 2s timeout
             response = requests.get('https://httpbin.org/status/200', timeout=2)
             self.offline_mode = response.status_code != 200
         except:
@@ -76,83 +314,349 @@ class LightweightAPIManager:
         """
         Universal API call method with built-in fallbacks
         """
-        if service_name not in self.service_registry:
-            return self._error_response(f"Service {service_name} not available")
+        dispatch = self._dispatch.get(service_name)
+        if dispatch is None:
+            if self._get_adapter(service_name) is None:
+                return self._error_response(f"Service {service_name} not available")
+            dispatch = self._dispatch[service_name]
         
-        # Check cache first
-        if cache_key and cache_key in self.cache:
-            cached_data = self.cache[cache_key]
-            if time.time() - cached_data['timestamp'] < self.cache_ttl:
-                return cached_data['data']
+        live_call, offline_call, uses_network = dispatch
         
-        # Get service adapter
-        adapter = self.service_registry[service_name]
+        # Only network-backed replies are cached - a simulator rebuilds its reply
+        # faster than the key can be hashed and a cached copy taken
+        if uses_network:
+            cache_key = cache_key or self._cache_key(service_name, endpoint, params)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
         
         try:
-            if self.offline_mode:
-                result = adapter.get_offline_response(endpoint, params)
+            # Only network-backed adapters pay for the probe; simulators follow the last known state
+            offline = self._ensure_connectivity() if uses_network else self.offline_mode
+            if offline or self._circuit_open(service_name):
+                result = offline_call(endpoint, params)
             else:
-                result = adapter.make_call(endpoint, params)
-                
-            # Cache successful responses
-            if cache_key and result.get('success'):
-                self.cache[cache_key] = {
-                    'data': result,
-                    'timestamp': time.time()
-                }
+                try:
+                    result = live_call(endpoint, params)
+                    self._record_success(service_name)
+                except Exception:
+                    # Count the failure against the breaker and degrade to offline answers
+                    self._record_failure(service_name)
+                    result = offline_call(endpoint, params)
+                    
+            if uses_network:
+                self._store_cached(cache_key, result)
+            return result
+            
+        except Exception as e:
+            return self._error_response(f"API call failed: {str(e)}")
+
+    async def make_api_call_async(self, service_name, endpoint, params=None, cache_key=None, session=None):
+        """
+        Async variant of make_api_call - overlaps network waits across calls
+        """
+        adapter = self._get_adapter(service_name)
+        make_call_async = getattr(adapter, 'make_call_async', None)
+        
+        # Simulators and sessionless calls run the sync path off the event loop
+        if (session is None or make_call_async is None or not self._uses_network(service_name)
+                or await asyncio.to_thread(self._ensure_connectivity) or self._circuit_open(service_name)):
+            return await asyncio.to_thread(self.make_api_call, service_name, endpoint, params, cache_key)
+        
+        cache_key = cache_key or self._cache_key(service_name, endpoint, params)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            try:
+                result = await make_call_async(session, endpoint, params)
+                self._record_success(service_name)
+            except Exception:
+                self._record_failure(service_name)
+                result = adapter.get_offline_response(endpoint, params)
                 
+            self._store_cached(cache_key, result)
             return result
             
         except Exception as e:
             return self._error_response(f"API call failed: {str(e)}")
 
+    async def gather_calls(self, calls, max_concurrency=5):
+        """
+        Issue [(service, endpoint, params), ...] concurrently
+        Latency drops from the sum of round trips to the slowest one
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def throttled(session, service_name, endpoint, params):
+            async with semaphore:
+                return await self.make_api_call_async(service_name, endpoint, params, session=session)
+        
+        # Connectivity is checked per call; a session is only opened when something may go live
+        if aiohttp is None or not any(self._uses_network(call[0]) for call in calls):
+            tasks = [asyncio.create_task(throttled(None, *call)) for call in calls]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [asyncio.create_task(throttled(session, *call)) for call in calls]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _circuit_open(self, service_name):
+        """True while a flapping service is short-circuited to offline answers"""
+        breaker = self._breakers.get(service_name)
+        return breaker is not None and time.monotonic() < breaker[1]
+
+    def _record_failure(self, service_name):
+        """Count a live failure; open the circuit once the threshold is reached"""
+        breaker = self._breakers.setdefault(service_name, [0, 0.0])
+        breaker[0] += 1
+        if breaker[0] >= self.breaker_threshold:
+            breaker[1] = time.monotonic() + self.breaker_cooldown
+
+    def _record_success(self, service_name):
+        """A live success closes the circuit"""
+        self._breakers.pop(service_name, None)
+
+    def make_api_call_bytes(self, service_name, endpoint, params=None, cache_key=None):
+        """
+        make_api_call serialised to JSON bytes for sending to clients
+        Static simulators reply with bytes encoded once at import
+        """
+        adapter = self._get_adapter(service_name)
+        encoded = adapter.cached_json() if adapter is not None else None
+        if encoded is not None:
+            return encoded
+        return _dumps(self.make_api_call(service_name, endpoint, params, cache_key))
+
+    def make_api_calls(self, batch):
+        """
+        Batch variant of make_api_call - one adapter dispatch per (service, endpoint)
+        batch: [(service_name, endpoint, params[, cache_key]), ...], results keep input order
+        """
+        results = [None] * len(batch)
+        groups = {}
+        get_adapter = self._get_adapter
+        make_cache_key = self._cache_key
+        cache_get = self._get_cached
+        dispatch = self._dispatch
+        
+        # Single sweep: reject unknown services, serve cache hits, group the rest
+        for index, call in enumerate(batch):
+            service_name, endpoint, params = call[:3]
+            cache_key = call[3] if len(call) > 3 else None
+            
+            if get_adapter(service_name) is None:
+                results[index] = self._error_response(f"Service {service_name} not available")
+                continue
+                
+            # As in make_api_call, simulator replies skip the cache entirely
+            if dispatch[service_name][2]:
+                cache_key = cache_key or make_cache_key(service_name, endpoint, params)
+                cached = cache_get(cache_key)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            else:
+                cache_key = None
+                
+            groups.setdefault((service_name, endpoint), []).append((index, params, cache_key))
+        
+        for (service_name, endpoint), pending in groups.items():
+            adapter = self._get_adapter(service_name)
+            param_list = [params for _, params, _ in pending]
+            offline = self._ensure_connectivity() if self._dispatch[service_name][2] else self.offline_mode
+            
+            if offline or self._circuit_open(service_name):
+                batch_results = [self._offline_or_error(adapter, endpoint, params) for params in param_list]
+            else:
+                # Failed entries come back in place, so only they fall back - the rest are never re-sent
+                batch_results = adapter.make_batch_call(endpoint, param_list)
+                for position, (params, result) in enumerate(zip(param_list, batch_results)):
+                    if isinstance(result, Exception):
+                        self._record_failure(service_name)
+                        batch_results[position] = self._offline_or_error(adapter, endpoint, params)
+                    else:
+                        self._record_success(service_name)
+            
+            for (index, _, cache_key), result in zip(pending, batch_results):
+                if cache_key is not None:
+                    self._store_cached(cache_key, result)
+                results[index] = result
+                
+        return results
+
+    def _offline_or_error(self, adapter, endpoint, params):
+        """Offline answer for one batch entry, or its error response if even that fails"""
+        try:
+            return adapter.get_offline_response(endpoint, params)
+        except Exception as e:
+            return self._error_response(f"API call failed: {str(e)}")
+
+    def _cache_key(self, service_name, endpoint, params):
+        """Deterministic 16-byte key - identical requests share one cache entry"""
+        canonical = json.dumps(params or {}, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.blake2b(f"{service_name}|{endpoint}|{canonical}".encode(), digest_size=16).digest()
+
+    def _get_cached(self, cache_key):
+        """Return a private copy of a fresh cached response, or None"""
+        cached = self.cache.get(cache_key)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _store_cached(self, cache_key, result):
+        """Cache successful responses - a snapshot, so callers may mutate what they got"""
+        if result.get('success'):
+            self.cache[cache_key] = copy.deepcopy(result)
+
     def _error_response(self, message):
         """Standard error response format"""
         return {
             'success': False,
             'error': message,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _iso_now(),
             'offline_mode': self.offline_mode
         }
 
-class WolframAlphaAdapter:
+class Adapter:
+    """Common adapter behaviour shared by every service"""
+    
+    __slots__ = ('session',)
+    
+    def __init__(self, session=None):
+        self.session = session
+        
+    def uses_network(self):
+        """Simulators answer in-process and never need the connectivity probe"""
+        return False
+        
+    def cached_json(self):
+        """Pre-encoded JSON reply for static simulators, None when the reply varies"""
+        return _RESPONSE_BYTES.get(type(self))
+
+    def make_batch_call(self, endpoint, param_list):
+        """
+        Default batch call - simulators simply map over their inputs
+        A failing entry comes back as its exception, like gather(return_exceptions=True)
+        """
+        return [self._call_or_error(endpoint, params) for params in param_list]
+
+    def _call_or_error(self, endpoint, params):
+        """make_call for one batch entry, returning rather than raising its exception"""
+        try:
+            return self.make_call(endpoint, params)
+        except Exception as e:
+            return e
+
+class WolframAlphaAdapter(Adapter):
     """Lightweight Wolfram Alpha API adapter"""
     
-    def __init__(self):
+    __slots__ = ('api_key', 'base_url', 'throttle_until', 'math_responses')
+    
+    # Offline answer tables - ordered, first matching pattern wins
+    DERIVATIVE_TABLE = _compile_answer_table((
+        ('x^2', "2x"),
+        ('sin(x)', "cos(x)"),
+        ('cos(x)', "-sin(x)"),
+        ('e^x', "e^x")
+    ))
+    INTEGRAL_TABLE = _compile_answer_table((
+        ('2x', "x^2 + C"),
+        ('cos(x)', "sin(x) + C"),
+        ('sin(x)', "-cos(x) + C")
+    ))
+    EQUATION_TABLE = _compile_answer_table((
+        ('2x = 8', "x = 4"),
+        ('x + 5 = 12', "x = 7"),
+        ('x^2 = 16', "x = 4 or x = -4")
+    ))
+    
+    def __init__(self, session=None):
+        super().__init__(session)
         self.api_key = os.getenv('WOLFRAM_ALPHA_API_KEY')
         self.base_url = "http://api.wolframalpha.com/v1"
+        self.throttle_until = 0.0  # Set when the API reports an exhausted rate limit
+        
+        # Basic offline math capabilities - bound once, tried in order
+        self.math_responses = (
+            ('derivative', self._calculate_basic_derivative),
+            ('integral', self._calculate_basic_integral),
+            ('solve', self._solve_basic_equation),
+            ('calculate', self._calculate_expression)
+        )
+        
+    def uses_network(self):
+        """Live calls reach the API only with a key and an HTTP session"""
+        return bool(self.api_key) and self.session is not None
         
     def make_call(self, endpoint, params):
         """Make actual API call to Wolfram Alpha"""
-        if not self.api_key:
+        if not self.api_key or self.session is None:
             return self.get_offline_response(endpoint, params)
             
+        # Network and parse errors propagate so the manager's circuit breaker sees them
+        self._wait_for_rate_limit()
+        full_params = {'appid': self.api_key, **params}
+        response = self.session.get(f"{self.base_url}/{endpoint}", params=full_params, timeout=10)
+        self._track_rate_limit(response.headers)
+        
+        return {
+            'success': True,
+            'data': self._parse_response(_loads(response.content)),
+            'source': 'wolfram_alpha'
+        }
+
+    def _wait_for_rate_limit(self):
+        """Pre-emptively hold off while the API says our quota is exhausted"""
+        wait = min(self.throttle_until - time.monotonic(), MAX_RETRY_AFTER)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _track_rate_limit(self, headers):
+        """Remember when the quota resets once x-ratelimit-remaining hits zero"""
+        if headers.get('x-ratelimit-remaining') != '0':
+            return
         try:
-            full_params = {'appid': self.api_key, **params}
-            response = requests.get(f"{self.base_url}/{endpoint}", params=full_params, timeout=10)
+            retry_after = float(headers.get('Retry-After', 1))
+        except ValueError:
+            retry_after = 1.0
+        self.throttle_until = time.monotonic() + min(max(retry_after, 0.0), MAX_RETRY_AFTER)
+
+    def make_batch_call(self, endpoint, param_list):
+        """Fan the batch out over the pooled session - one query per request"""
+        if not self.api_key or self.session is None:
+            return [self.get_offline_response(endpoint, params) for params in param_list]
             
-            return {
-                'success': True,
-                'data': self._parse_response(response.json()),
-                'source': 'wolfram_alpha'
-            }
-        except Exception as e:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(lambda params: self._call_or_error(endpoint, params), param_list))
+
+    async def make_call_async(self, session, endpoint, params):
+        """Non-blocking Wolfram Alpha call on a shared aiohttp session"""
+        if not self.api_key:
             return self.get_offline_response(endpoint, params)
+            
+        wait = min(self.throttle_until - time.monotonic(), MAX_RETRY_AFTER)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        full_params = {'appid': self.api_key, **params}
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with session.get(f"{self.base_url}/{endpoint}", params=full_params, timeout=timeout) as response:
+            self._track_rate_limit(response.headers)
+            data = _loads(await response.read())
+        
+        return {
+            'success': True,
+            'data': self._parse_response(data),
+            'source': 'wolfram_alpha'
+        }
 
     def get_offline_response(self, endpoint, params):
         """Offline fallback for mathematical queries"""
         query = params.get('query', '').lower()
+        requested = set(_MATH_ROUTE_PATTERN.findall(query))
         
-        # Basic offline math capabilities
-        math_responses = {
-            'derivative': self._calculate_basic_derivative,
-            'integral': self._calculate_basic_integral,
-            'solve': self._solve_basic_equation,
-            'calculate': self._calculate_expression
-        }
-        
-        for math_type, calculator in math_responses.items():
-            if math_type in query:
+        for math_type, calculator in self.math_responses:
+            if math_type in requested:
                 result = calculator(query)
                 if result:
                     return {
@@ -170,59 +674,50 @@ class WolframAlphaAdapter:
 
     def _calculate_basic_derivative(self, query):
         """Basic derivative calculation offline"""
-        try:
-            # Simple pattern matching for common derivatives
-            if 'x^2' in query:
-                return "2x"
-            elif 'sin(x)' in query:
-                return "cos(x)"
-            elif 'cos(x)' in query:
-                return "-sin(x)"
-            elif 'e^x' in query:
-                return "e^x"
-            return None
-        except:
-            return None
+        return self._lookup(self.DERIVATIVE_TABLE, query)
 
     def _calculate_basic_integral(self, query):
         """Basic integral calculation offline"""
-        try:
-            if '2x' in query:
-                return "x^2 + C"
-            elif 'cos(x)' in query:
-                return "sin(x) + C"
-            elif 'sin(x)' in query:
-                return "-cos(x) + C"
-            return None
-        except:
-            return None
+        return self._lookup(self.INTEGRAL_TABLE, query)
 
     def _solve_basic_equation(self, query):
         """Solve basic equations offline"""
-        try:
-            if '2x = 8' in query:
-                return "x = 4"
-            elif 'x + 5 = 12' in query:
-                return "x = 7"
-            elif 'x^2 = 16' in query:
-                return "x = 4 or x = -4"
-            return None
-        except:
-            return None
+        return self._lookup(self.EQUATION_TABLE, query)
 
     def _calculate_expression(self, query):
-        """Calculate basic expressions offline"""
+        """Calculate a single basic 'a OP b' expression offline"""
+        expression = query.rpartition('calculate')[2].strip().rstrip('?!.=').rstrip()
+        match = _EXPRESSION_PATTERN.fullmatch(expression)
+        if not match:
+            return None
+            
+        left, op, right = match.groups()
         try:
-            # Extract numbers and basic operations
-            if '2+2' in query:
-                return "4"
-            elif '5*8' in query:
-                return "40"
-            elif '15/3' in query:
-                return "5"
+            if '.' in left or '.' in right:
+                value = _OPERATORS[op](float(left), float(right))
+            else:
+                # Integer operands stay exact; only a non-whole quotient becomes a float
+                left, right = int(left), int(right)
+                if op != '/':
+                    return str(_OPERATORS[op](left, right))
+                if left % right == 0:
+                    return str(left // right)
+                value = left / right
+        except (ZeroDivisionError, OverflowError):
             return None
-        except:
+            
+        if not math.isfinite(value):
             return None
+        return str(int(value)) if value.is_integer() and abs(value) < 2 ** 53 else str(value)
+
+    @staticmethod
+    def _lookup(table, query):
+        """Single overlapping regex pass; the earliest table entry present wins"""
+        pattern, ranked = table
+        hits = pattern.findall(query)
+        if not hits:
+            return None
+        return min(ranked[hit] for hit in hits)[1]
 
     def _parse_response(self, data):
         """Parse Wolfram Alpha response"""
@@ -232,26 +727,148 @@ class WolframAlphaAdapter:
             'visualization': data.get('visualization', '')
         }
 
-class MathComputationAdapter:
+# ==================== Simulator responses ====================
+# Builders return a fresh literal per call, so callers may mutate their reply;
+# the pre-encoded bytes below come from the same builders
+
+def _math_response():
+    return {
+        'success': True,
+        'data': {'message': 'Math computation service ready'},
+        'source': 'math_computation'
+    }
+
+def _math_offline_response():
+    return {
+        'success': True,
+        'data': {'message': 'Offline math computation available'},
+        'source': 'offline_math'
+    }
+
+def _task_response():
+    return {
+        'success': True,
+        'data': {
+            'tasks': [
+                {'id': 1, 'title': 'Complete API integration', 'completed': False},
+                {'id': 2, 'title': 'Test offline functionality', 'completed': True},
+                {'id': 3, 'title': 'Document new features', 'completed': False}
+            ]
+        },
+        'source': 'task_simulation'
+    }
+
+_DATA_ANALYSIS_INSIGHTS = (
+    "Correlation: Marketing spend strongly correlates with revenue",
+    "Recommendation: Increase investment in top-performing channels"
+)
+
+_DATA_ANALYSIS_METRICS = {
+    'growth_rate': '15.2%',
+    'correlation_strength': '0.78',
+    'confidence': '95%'
+}
+
+def _accounting_response():
+    return {
+        'success': True,
+        'data': {
+            'financial_statements': {
+                'balance_sheet': {
+                    'assets': 150000,
+                    'liabilities': 75000,
+                    'equity': 75000
+                },
+                'income_statement': {
+                    'revenue': 50000,
+                    'expenses': 35000,
+                    'net_income': 15000
+                }
+            },
+            'health_metrics': {
+                'current_ratio': 2.0,
+                'debt_to_equity': 1.0,
+                'profit_margin': '30%'
+            }
+        },
+        'source': 'accounting_simulation'
+    }
+
+def _agriculture_response():
+    return {
+        'success': True,
+        'data': {
+            'field_metrics': {
+                'soil_moisture': '45%',
+                'temperature': '22°C',
+                'humidity': '65%'
+            },
+            'crop_health': 'Good',
+            'recommendations': [
+                'Optimal planting conditions detected',
+                'Consider irrigation in 3 days',
+                'Pest risk: Low'
+            ]
+        },
+        'source': 'agriculture_simulation'
+    }
+
+def _project_response():
+    return {
+        'success': True,
+        'data': {
+            'projects': [
+                {
+                    'name': 'ZaraAI Phase 5',
+                    'progress': '75%',
+                    'milestones': ['API Foundation', 'Domain Integration', 'Testing'],
+                    'status': 'On Track'
+                }
+            ],
+            'team_metrics': {
+                'productivity': '88%',
+                'burnout_risk': 'Low',
+                'collaboration': 'High'
+            }
+        },
+        'source': 'project_management_simulation'
+    }
+
+def _relationship_response():
+    return {
+        'success': True,
+        'data': {
+            'insights': [
+                "Communication patterns: Healthy and open",
+                "Emotional connection: Strong and growing", 
+                "Conflict resolution: Effective and respectful"
+            ],
+            'suggestions': [
+                "Schedule quality time this weekend",
+                "Practice active listening techniques",
+                "Express appreciation daily"
+            ],
+            'health_score': '9.2/10'
+        },
+        'source': 'relationship_analysis'
+    }
+
+class MathComputationAdapter(Adapter):
     """Lightweight general math computation adapter"""
     
+    __slots__ = ()
+    
     def make_call(self, endpoint, params):
-        return {
-            'success': True,
-            'data': {'message': 'Math computation service ready'},
-            'source': 'math_computation'
-        }
+        return _math_response()
     
     def get_offline_response(self, endpoint, params):
-        return {
-            'success': True,
-            'data': {'message': 'Offline math computation available'},
-            'source': 'offline_math'
-        }
+        return _math_offline_response()
 
-class CalendarAdapter:
+class CalendarAdapter(Adapter):
     """Lightweight calendar API adapter with simulation"""
     
+    __slots__ = ()
+    
     def make_call(self, endpoint, params):
         # Simulated calendar integration
         events = self._simulate_calendar_events()
@@ -266,47 +883,39 @@ class CalendarAdapter:
     
     def _simulate_calendar_events(self):
         """Simulate calendar events for demo"""
+        today = datetime.now().strftime('%Y-%m-%d')
         return {
             'events': [
                 {
                     'title': 'Team Meeting',
                     'time': '10:00 AM',
-                    'date': datetime.now().strftime('%Y-%m-%d')
+                    'date': today
                 },
                 {
                     'title': 'Project Review',
                     'time': '2:00 PM', 
-                    'date': datetime.now().strftime('%Y-%m-%d')
+                    'date': today
                 }
             ],
             'source': 'simulated_calendar'
         }
 
-class TaskAdapter:
+class TaskAdapter(Adapter):
     """Lightweight task management adapter"""
     
+    __slots__ = ()
+    
     def make_call(self, endpoint, params):
-        return {
-            'success': True,
-            'data': self._simulate_tasks(),
-            'source': 'task_simulation'
-        }
+        return _task_response()
     
     def get_offline_response(self, endpoint, params):
-        return self.make_call(endpoint, params)
-    
-    def _simulate_tasks(self):
-        return {
-            'tasks': [
-                {'id': 1, 'title': 'Complete API integration', 'completed': False},
-                {'id': 2, 'title': 'Test offline functionality', 'completed': True},
-                {'id': 3, 'title': 'Document new features', 'completed': False}
-            ]
-        }
+        return _task_response()
 
-class DataAnalysisAdapter:
+class DataAnalysisAdapter(Adapter):
     """Lightweight data analysis adapter"""
     
+    __slots__ = ()
+    
     def make_call(self, endpoint, params):
         return {
             'success': True,
@@ -320,138 +929,62 @@ class DataAnalysisAdapter:
     def _simulate_analysis(self, params):
         dataset = params.get('dataset', 'sales')
         return {
-            'insights': [
-                f"Trend analysis for {dataset}: Positive growth detected",
-                "Correlation: Marketing spend strongly correlates with revenue",
-                "Recommendation: Increase investment in top-performing channels"
-            ],
-            'metrics': {
-                'growth_rate': '15.2%',
-                'correlation_strength': '0.78',
-                'confidence': '95%'
-            }
+            'insights': [f"Trend analysis for {dataset}: Positive growth detected", *_DATA_ANALYSIS_INSIGHTS],
+            'metrics': dict(_DATA_ANALYSIS_METRICS)
         }
 
-class AccountingAdapter:
+class AccountingAdapter(Adapter):
     """Lightweight accounting integration adapter"""
     
+    __slots__ = ()
+    
     def make_call(self, endpoint, params):
-        return {
-            'success': True,
-            'data': self._simulate_accounting_data(),
-            'source': 'accounting_simulation'
-        }
+        return _accounting_response()
     
     def get_offline_response(self, endpoint, params):
-        return self.make_call(endpoint, params)
-    
-    def _simulate_accounting_data(self):
-        return {
-            'financial_statements': {
-                'balance_sheet': {
-                    'assets': 150000,
-                    'liabilities': 75000,
-                    'equity': 75000
-                },
-                'income_statement': {
-                    'revenue': 50000,
-                    'expenses': 35000,
-                    'net_income': 15000
-                }
-            },
-            'health_metrics': {
-                'current_ratio': 2.0,
-                'debt_to_equity': 1.0,
-                'profit_margin': '30%'
-            }
-        }
+        return _accounting_response()
 
-class AgricultureAdapter:
+class AgricultureAdapter(Adapter):
     """Lightweight agriculture data adapter"""
     
+    __slots__ = ()
+    
     def make_call(self, endpoint, params):
-        return {
-            'success': True,
-            'data': self._simulate_agriculture_data(),
-            'source': 'agriculture_simulation'
-        }
+        return _agriculture_response()
     
     def get_offline_response(self, endpoint, params):
-        return self.make_call(endpoint, params)
-    
-    def _simulate_agriculture_data(self):
-        return {
-            'field_metrics': {
-                'soil_moisture': '45%',
-                'temperature': '22°C',
-                'humidity': '65%'
-            },
-            'crop_health': 'Good',
-            'recommendations': [
-                'Optimal planting conditions detected',
-                'Consider irrigation in 3 days',
-                'Pest risk: Low'
-            ]
-        }
+        return _agriculture_response()
 
-class ProjectManagementAdapter:
+class ProjectManagementAdapter(Adapter):
     """Lightweight project management adapter"""
     
+    __slots__ = ()
+    
     def make_call(self, endpoint, params):
-        return {
-            'success': True,
-            'data': self._simulate_project_data(),
-            'source': 'project_management_simulation'
-        }
+        return _project_response()
     
     def get_offline_response(self, endpoint, params):
-        return self.make_call(endpoint, params)
-    
-    def _simulate_project_data(self):
-        return {
-            'projects': [
-                {
-                    'name': 'ZaraAI Phase 5',
-                    'progress': '75%',
-                    'milestones': ['API Foundation', 'Domain Integration', 'Testing'],
-                    'status': 'On Track'
-                }
-            ],
-            'team_metrics': {
-                'productivity': '88%',
-                'burnout_risk': 'Low',
-                'collaboration': 'High'
-            }
-        }
+        return _project_response()
 
-class RelationshipAdapter:
+class RelationshipAdapter(Adapter):
     """Lightweight relationship intelligence adapter"""
     
+    __slots__ = ()
+    
     def make_call(self, endpoint, params):
-        return {
-            'success': True,
-            'data': self._analyze_relationship(params),
-            'source': 'relationship_analysis'
-        }
+        return _relationship_response()
     
     def get_offline_response(self, endpoint, params):
-        return self.make_call(endpoint, params)
-    
-    def _analyze_relationship(self, params):
-        context = params.get('context', 'general')
-        return {
-            'insights': [
-                "Communication patterns: Healthy and open",
-                "Emotional connection: Strong and growing", 
-                "Conflict resolution: Effective and respectful"
-            ],
-            'suggestions': [
-                "Schedule quality time this weekend",
-                "Practice active listening techniques",
-                "Express appreciation daily"
-            ],
-            'health_score': '9.2/10'
-        }
+        return _relationship_response()
+
+# Static simulators answer identically online and offline, so encode once at import
+_RESPONSE_BYTES = {
+    TaskAdapter: _dumps(_task_response()),
+    AccountingAdapter: _dumps(_accounting_response()),
+    AgricultureAdapter: _dumps(_agriculture_response()),
+    ProjectManagementAdapter: _dumps(_project_response()),
+    RelationshipAdapter: _dumps(_relationship_response())
+}
 
 # Integration with existing ZaraAI architecture
 def integrate_api_manager():
@@ -482,8 +1015,7 @@ if __name__ == "__main__":
     # Test initialization
     manager = LightweightAPIManager()
     
-    print(f"\n🔌 Offline Mode: {manager.offline_mode}")
-    print(f"📊 Available Services: {len(manager.service_registry)}")
+    print(f"\n📊 Available Services: {len(manager.service_factories)}")
     
     # Test a sample API call
     result = manager.make_api_call(
@@ -493,7 +1025,8 @@ if __name__ == "__main__":
         cache_key='derivative_test'
     )
     
-    print(f"\n🧪 Test Result: {result.get('success', False)}")
+    print(f"\n🔌 Offline Mode: {manager.offline_mode}")
+    print(f"🧪 Test Result: {result.get('success', False)}")
     print(f"📝 Source: {result.get('source', 'unknown')}")
     
     print("\n🚀 Phase 5 API Foundation Ready for Integration!")
@@ -10,35 +10,42 @@ DEPENDENCIES: Built on existing ZaraAI phases
 # 💼 PURPOSE: Comprehensive career development and professional growth
 # 🚀 DESIGN: Strategic career guidance with emotional intelligence
 
-import re
 import json
 import time
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import IntEnum
+from functools import cached_property
 from collections import defaultdict
-import random
+
+from api_integration_manager import LRUCache
 
 # ==================== [MODULE: SKILL GAP ANALYSIS] ====================
 # 📊 PURPOSE: Identify career-limiting skill gaps
 # 🎯 DESIGN: Market-aligned skill assessment
 
-class CareerLevel(Enum):
+class CareerLevel(IntEnum):
     ENTRY = 1           # 0-2 years experience
     MID = 2             # 3-7 years experience  
     SENIOR = 3          # 8+ years experience
     LEADERSHIP = 4      # Management/executive
     TRANSITION = 5      # Career changing
 
+# Distinct target roles whose skill prioritisation is memoised
+MAX_CACHED_ROLE_PRIORITIES = 256
+
 class SkillGapAnalyzer:
     """
     ENHANCEMENT 2A: AI-Powered Career Skill Analysis
     DESIGN: Market-informed skill gap identification
     """
     
+    __slots__ = ('skill_frameworks', 'market_trends', 'industry_standards', '_priority_by_role')
+    
     def __init__(self):
         self.skill_frameworks = self._initialize_skill_frameworks()
         self.market_trends = self._load_market_trends()
         self.industry_standards = self._load_industry_standards()
+        self._priority_by_role = LRUCache(MAX_CACHED_ROLE_PRIORITIES)  # target_role -> prioritization
         
     def conduct_skill_assessment(self, current_role, target_role, experience_level):
         """ENHANCEMENT 2A.1: Comprehensive skill gap analysis"""
@@ -53,22 +60,32 @@ class SkillGapAnalyzer:
             'learning_urgency': self._assess_learning_urgency(target_role)
         }
         
-        return {
-            **gap_analysis,
+        gap_analysis.update({
             'market_relevance': self._assess_market_demand(target_skills),
             'timeline_estimation': self._estimate_skill_acquisition_timeline(gap_analysis['skill_gaps']),
             'encouragement': "Every skill gap is a growth opportunity waiting to be unlocked! 🔑"
-        }
+        })
+        return gap_analysis
     
     def _prioritize_skill_gaps(self, target_role):
         """ENHANCEMENT 2A.2: Strategic skill prioritization"""
-        critical_skills = self._identify_critical_skills(target_role)
-        emerging_skills = self._identify_emerging_skills(target_role)
-        
+        priorities = self._priority_by_role.get(target_role)
+        if priorities is None:
+            critical_skills = self._identify_critical_skills(target_role)
+            emerging_skills = self._identify_emerging_skills(target_role)
+            
+            # Memoised as tuples so no user's plan can edit the shared entry
+            priorities = self._priority_by_role[target_role] = (
+                tuple(critical_skills[:3]),  # Top 3 critical skills
+                tuple(emerging_skills[:2]),  # Future-proofing skills
+                tuple(self._identify_maintenance_skills(target_role))
+            )
+            
+        immediate_focus, strategic_investments, foundational_maintenance = priorities
         return {
-            'immediate_focus': critical_skills[:3],  # Top 3 critical skills
-            'strategic_investments': emerging_skills[:2],  # Future-proofing skills
-            'foundational_maintenance': self._identify_maintenance_skills(target_role)
+            'immediate_focus': list(immediate_focus),
+            'strategic_investments': list(strategic_investments),
+            'foundational_maintenance': list(foundational_maintenance)
         }
 
 # ==================== [MODULE: RESUME OPTIMIZATION] ====================
@@ -81,6 +98,8 @@ class ResumeOptimizer:
     DESIGN: Balance between ATS optimization and human appeal
     """
     
+    __slots__ = ('ats_keywords', 'achievement_frameworks', 'industry_templates')
+    
     def __init__(self):
         self.ats_keywords = self._load_ats_keywords()
         self.achievement_frameworks = self._create_achievement_frameworks()
@@ -96,23 +115,20 @@ class ResumeOptimizer:
             'impact_metrics': self._suggest_quantifiable_achievements(current_resume)
         }
         
-        return {
-            **optimization_plan,
+        optimization_plan.update({
             'before_after_examples': self._provide_transformation_examples(target_roles),
             'confidence_boost': "Your resume is about to become a powerful career advancement tool! 💪"
-        }
+        })
+        return optimization_plan
     
     def _enhance_achievement_statements(self, resume):
         """ENHANCEMENT 2B.2: Transform responsibilities into achievements"""
-        enhancements = []
+        experiences = resume.get('experience', [])
+        transform = self._transform_responsibility_to_achievement
         
-        for experience in resume.get('experience', []):
-            enhanced = self._transform_responsibility_to_achievement(experience)
-            enhancements.append(enhanced)
-            
         return {
-            'original_statements': [exp.get('description', '') for exp in resume.get('experience', [])],
-            'enhanced_statements': enhancements,
+            'original_statements': [exp.get('description', '') for exp in experiences],
+            'enhanced_statements': [transform(exp) for exp in experiences],
             'improvement_ratio': '60-80% more impactful'
         }
 
@@ -126,6 +142,8 @@ class InterviewPreparation:
     DESIGN: Behavioral and technical interview mastery
     """
     
+    __slots__ = ('question_banks', 'star_method', 'technical_assessments', 'negotiation_coach')
+    
     def __init__(self):
         self.question_banks = self._create_question_banks()
         self.star_method = STARMethodCoach()
@@ -142,11 +160,11 @@ class InterviewPreparation:
             'confidence_building': self._build_interview_confidence_strategies()
         }
         
-        return {
-            **prep_plan,
+        prep_plan.update({
             'success_mindset': "Interviews are conversations, not interrogations. You've got this! 🗣️",
             'last_minute_tips': self._provide_last_minute_preparation()
-        }
+        })
+        return prep_plan
     
     def conduct_mock_interview(self, interview_type, difficulty_level):
         """ENHANCEMENT 2C.2: Realistic interview simulation"""
@@ -170,6 +188,8 @@ class CareerPathPlanner:
     DESIGN: Personalized career roadmap with multiple pathways
     """
     
+    __slots__ = ('career_frameworks', 'transition_strategies', 'milestone_planner')
+    
     def __init__(self):
         self.career_frameworks = self._create_career_frameworks()
         self.transition_strategies = self._develop_transition_strategies()
@@ -185,12 +205,12 @@ class CareerPathPlanner:
             'promotion_strategies': self._develop_promotion_strategies(current_position)
         }
         
-        return {
-            **roadmap,
+        roadmap.update({
             'alternative_paths': self._explore_alternative_career_paths(career_goals),
             'progress_tracking': self._setup_career_progress_tracking(),
             'motivational_framework': "Your career journey is unique - let's make it extraordinary! 🌠"
-        }
+        })
+        return roadmap
 
 # ==================== [MODULE: PROFESSIONAL NETWORKING] ====================
 # 🤝 PURPOSE: Strategic relationship building
@@ -202,6 +222,8 @@ class NetworkingStrategist:
     DESIGN: Authentic relationship building for career growth
     """
     
+    __slots__ = ('networking_frameworks', 'connection_strategies', 'followup_systems')
+    
     def __init__(self):
         self.networking_frameworks = self._create_networking_frameworks()
         self.connection_strategies = self._develop_connection_strategies()
@@ -217,11 +239,11 @@ class NetworkingStrategist:
             'networking_events': self._recommend_relevant_events(career_goals)
         }
         
-        return {
-            **networking_plan,
+        networking_plan.update({
             'authenticity_reminder': "Genuine curiosity builds lasting professional relationships 🎯",
             'followup_framework': self._create_followup_system()
-        }
+        })
+        return networking_plan
 
 # ==================== [MODULE: SALARY NEGOTIATION] ====================
 # 💰 PURPOSE: Confident compensation negotiation
@@ -233,6 +255,8 @@ class SalaryNegotiationCoach:
     DESIGN: Data-driven negotiation with emotional intelligence
     """
     
+    __slots__ = ('salary_data', 'negotiation_scripts', 'value_proposition')
+    
     def __init__(self):
         self.salary_data = self._load_salary_benchmarks()
         self.negotiation_scripts = self._create_negotiation_scripts()
@@ -248,11 +272,11 @@ class SalaryNegotiationCoach:
             'timing_strategies': self._optimize_negotiation_timing()
         }
         
-        return {
-            **negotiation_plan,
+        negotiation_plan.update({
             'confidence_builders': self._build_negotiation_confidence(),
             'mindset_preparation': "Negotiation is about finding mutual value, not confrontation 🤝"
-        }
+        })
+        return negotiation_plan
 
 # ==================== [MODULE: CAREER TRANSITION] ====================
 # 🔄 PURPOSE: Smooth career changes and pivots
@@ -264,6 +288,8 @@ class CareerTransitionCoach:
     DESIGN: Compassionate guidance through career changes
     """
     
+    __slots__ = ('transition_frameworks', 'skill_transfer', 'mental_preparation')
+    
     def __init__(self):
         self.transition_frameworks = self._create_transition_frameworks()
         self.skill_transfer = SkillTransferAnalyzer()
@@ -279,16 +305,18 @@ class CareerTransitionCoach:
             'support_systems': self._establish_transition_support()
         }
         
-        return {
-            **transition_plan,
+        transition_plan.update({
             'emotional_support': self._provide_transition_emotional_support(transition_type),
             'success_stories': self._share_relevant_transition_stories(current_career, target_career),
             'encouragement': "Career transitions are acts of courage - you're writing your next chapter! 📖"
-        }
+        })
+        return transition_plan
 
 # ==================== [CAREER COORDINATOR] ====================
 # 💼 PURPOSE: Unified career development management
 
+MAX_ACTIVE_CAREER_PROFILES = 10000
+
 class CareerEnhancementManager:
     """
     ENHANCEMENT 2: Comprehensive Career Growth System
@@ -297,16 +325,37 @@ class CareerEnhancementManager:
     
     def __init__(self, intelligence_manager):
         self.intelligence_manager = intelligence_manager
-        self.skill_analyzer = SkillGapAnalyzer()
-        self.resume_optimizer = ResumeOptimizer()
-        self.interview_coach = InterviewPreparation()
-        self.career_planner = CareerPathPlanner()
-        self.networking_strategist = NetworkingStrategist()
-        self.negotiation_coach = SalaryNegotiationCoach()
-        self.transition_coach = CareerTransitionCoach()
-        
-        self.career_profiles = {}  # user_id -> career_profile
+        self.career_profiles = LRUCache(MAX_ACTIVE_CAREER_PROFILES)  # user_id -> career_profile
         
+    # Sub-coaches are built on first use - most sessions only touch one or two
+    @cached_property
+    def skill_analyzer(self):
+        return SkillGapAnalyzer()
+    
+    @cached_property
+    def resume_optimizer(self):
+        return ResumeOptimizer()
+    
+    @cached_property
+    def interview_coach(self):
+        return InterviewPreparation()
+    
+    @cached_property
+    def career_planner(self):
+        return CareerPathPlanner()
+    
+    @cached_property
+    def networking_strategist(self):
+        return NetworkingStrategist()
+    
+    @cached_property
+    def negotiation_coach(self):
+        return SalaryNegotiationCoach()
+    
+    @cached_property
+    def transition_coach(self):
+        return CareerTransitionCoach()
+    
     def initialize_career_journey(self, user_id, career_aspirations, current_position):
         """ENHANCEMENT 2.1: Start personalized career development"""
         # Conduct initial career assessment
@@ -355,24 +404,27 @@ class CareerEnhancementManager:
             'preparation_tasks': self._assign_preparation_tasks(profile, week_context)
         }
         
-        return {
-            **weekly_guidance,
+        weekly_guidance.update({
             'motivational_insight': self._get_career_encouragement(profile),
             'progress_celebration': self._acknowledge_career_wins(profile)
-        }
+        })
+        return weekly_guidance
     
     def handle_job_search_support(self, user_id, search_parameters):
         """ENHANCEMENT 2.3: Comprehensive job search assistance"""
         profile = self.career_profiles.get(user_id)
         
+        target_role = profile['career_aspirations']['target_role']
+        
+        # The planners are in-process and do no I/O - a thread pool would only add overhead
         job_search_plan = {
             'resume_optimization': self.resume_optimizer.optimize_resume(
                 profile.get('current_resume', {}), 
-                [profile['career_aspirations']['target_role']],
+                [target_role],
                 profile['current_position']['experience_level']
             ),
             'interview_preparation': self.interview_coach.create_interview_prep_plan(
-                profile['career_aspirations']['target_role'],
+                target_role,
                 search_parameters.get('target_companies', []),
                 search_parameters.get('interview_rounds', 3)
             ),
@@ -380,11 +432,11 @@ class CareerEnhancementManager:
             'search_motivation': self._maintain_job_search_momentum()
         }
         
-        return {
-            **job_search_plan,
+        job_search_plan.update({
             'search_encouragement': "The right opportunity is looking for someone exactly like you! ✨",
             'resilience_building': "Every 'no' brings you closer to your perfect 'yes' 💫"
-        }
+        })
+        return job_search_plan
 
 # ==================== [INTEGRATION FUNCTION] ====================
 
@@ -398,7 +450,10 @@ def initialize_career_enhancement(intelligence_manager):
 # 💼 MILESTONE: Career Enhancement Ready
 # 🚀 DESIGN: Strategic, compassionate career growth support
 
-if __name__ == "__main__":
+def _smoke_test():
+    """Manual smoke test - heavy sibling modules are only imported here"""
+    import gc
+    
     print("💼 ZaraAI Career Enhancement - TEST")
     
     # Test career system
@@ -430,3 +485,10 @@ if __name__ == "__main__":
     print(f"📊 Skill Gaps Identified: {len(journey['career_assessment']['skill_gaps'])}")
     print(f"🚀 Support Style: {journey['support_commitment']}")
     print("💫 Ready to accelerate career growth!")
+    
+    # Release the transient managers before returning to the caller
+    del journey, career_mgr, intel_mgr, domain_mgr, api_mgr
+    gc.collect()
+
+if __name__ == "__main__":
+    _smoke_test()
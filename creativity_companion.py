@@ -10,19 +10,19 @@ DEPENDENCIES: Built on existing ZaraAI phases
 # 🎨 PURPOSE: Comprehensive creative support and innovation guidance
 # ✨ DESIGN: Inspiration meets practical creative execution
 
-import re
+import copy
 import json
 import time
-import random
-from datetime import datetime, timedelta
-from enum import Enum
-from collections import defaultdict
+from enum import IntEnum
+from functools import cached_property
+
+from api_integration_manager import LRUCache
 
 # ==================== [MODULE: CREATIVE MINDSET] ====================
 # 🧠 PURPOSE: Cultivating creative thinking patterns
 # 🌱 DESIGN: Growth mindset for creativity
 
-class CreativeDomain(Enum):
+class CreativeDomain(IntEnum):
     WRITING = 1           # Fiction, poetry, content creation
     VISUAL_ARTS = 2       # Drawing, painting, digital art
     MUSIC = 3             # Composition, performance, production
@@ -30,12 +30,21 @@ class CreativeDomain(Enum):
     PERFORMANCE = 5       # Theater, dance, public speaking
     CRAFTS = 6            # Handicrafts, DIY, making
 
+# Encouragement by mindset score bucket: < 4, < 7, otherwise
+_CREATIVE_ENCOURAGEMENT = (
+    "Every creative journey begins with a single act of courage. Your creativity is waiting to be unleashed! 🌟",
+    "Your creative spirit is awakening! Embrace the beautiful mess of the creative process 🎨",
+    "You're cultivating a vibrant creative life! Keep nurturing your unique artistic voice 💫",
+)
+
 class CreativeMindsetCoach:
     """
     ENHANCEMENT 5A: Creative Mindset Development
     DESIGN: Overcoming creative blocks and building creative confidence
     """
     
+    __slots__ = ('creative_myths', 'mindset_shifts', 'flow_state_techniques')
+    
     def __init__(self):
         self.creative_myths = self._identify_creative_myths()
         self.mindset_shifts = self._develop_mindset_shifts()
@@ -51,21 +60,15 @@ class CreativeMindsetCoach:
             'growth_potential': self._evaluate_creative_capacity(creative_history)
         }
         
-        return {
-            **mindset_assessment,
-            'mindset_score': self._calculate_mindset_health(mindset_assessment),
-            'empowerment_statements': self._create_empowerment_affirmations(mindset_assessment),
-            'encouragement': self._get_creative_encouragement(mindset_assessment)
-        }
+        mindset_assessment['mindset_score'] = self._calculate_mindset_health(mindset_assessment)
+        mindset_assessment['empowerment_statements'] = self._create_empowerment_affirmations(mindset_assessment)
+        mindset_assessment['encouragement'] = self._get_creative_encouragement(mindset_assessment)
+        return mindset_assessment
     
     def _get_creative_encouragement(self, assessment):
         """ENHANCEMENT 5A.2: Personalized creative encouragement"""
-        if assessment['mindset_score'] < 4:
-            return "Every creative journey begins with a single act of courage. Your creativity is waiting to be unleashed! 🌟"
-        elif assessment['mindset_score'] < 7:
-            return "Your creative spirit is awakening! Embrace the beautiful mess of the creative process 🎨"
-        else:
-            return "You're cultivating a vibrant creative life! Keep nurturing your unique artistic voice 💫"
+        score = assessment['mindset_score']
+        return _CREATIVE_ENCOURAGEMENT[0 if score < 4 else 1 if score < 7 else 2]
 
 # ==================== [MODULE: IDEA GENERATION] ====================
 # 💡 PURPOSE: Systematic idea creation and development
@@ -77,6 +80,8 @@ class IdeaGenerator:
     DESIGN: Structured creativity with spontaneous inspiration
     """
     
+    __slots__ = ('brainstorming_methods', 'inspiration_sources', 'connection_making')
+    
     def __init__(self):
         self.brainstorming_methods = self._learn_brainstorming_techniques()
         self.inspiration_sources = self._curate_inspiration_library()
@@ -92,12 +97,12 @@ class IdeaGenerator:
             'idea_development': self._help_refine_raw_ideas(creative_domain)
         }
         
-        return {
-            **idea_session,
+        idea_session.update({
             'creative_philosophy': 'Quantity breeds quality - generate freely, edit later',
             'fun_elements': self._add_playful_creativity_elements(creative_domain),
             'followup_actions': self._suggest_idea_development_steps()
-        }
+        })
+        return idea_session
 
 # ==================== [MODULE: CREATIVE BLOCK BUSTER] ====================
 # 🚧 PURPOSE: Overcoming creative resistance and blocks
@@ -109,6 +114,8 @@ class CreativeBlockBuster:
     DESIGN: Understanding and overcoming creative resistance
     """
     
+    __slots__ = ('block_types', 'breakthrough_techniques', 'self_compassion')
+    
     def __init__(self):
         self.block_types = self._categorize_creative_blocks()
         self.breakthrough_techniques = self._develop_breakthrough_methods()
@@ -124,11 +131,11 @@ class CreativeBlockBuster:
             'support_system': self._build_creative_support(creative_context)
         }
         
-        return {
-            **breakthrough_plan,
+        breakthrough_plan.update({
             'compassionate_message': "Creative blocks are part of the process, not a reflection of your talent 🌈",
             'progress_celebration': "Every small creative act builds momentum against resistance 🎉"
-        }
+        })
+        return breakthrough_plan
 
 # ==================== [MODULE: PROJECT INCUBATION] ====================
 # 🐣 PURPOSE: Nurturing creative projects from idea to completion
@@ -140,6 +147,8 @@ class ProjectIncubator:
     DESIGN: From inspiration to finished creation
     """
     
+    __slots__ = ('project_frameworks', 'milestone_planning', 'momentum_maintenance')
+    
     def __init__(self):
         self.project_frameworks = self._create_project_frameworks()
         self.milestone_planning = self._develop_milestone_systems()
@@ -155,12 +164,12 @@ class ProjectIncubator:
             'completion_strategies': self._plan_for_successful_finishing()
         }
         
-        return {
-            **incubation_plan,
+        incubation_plan.update({
             'creative_process_philosophy': 'Trust the process - each step brings you closer to your vision',
             'flexibility_framework': 'Creative projects evolve - embrace the journey of discovery',
             'celebration_plan': self._plan_project_milestone_celebrations()
-        }
+        })
+        return incubation_plan
 
 # ==================== [MODULE: SKILL DEVELOPMENT] ====================
 # 🛠️ PURPOSE: Building creative technical skills
@@ -172,6 +181,8 @@ class CreativeSkillDeveloper:
     DESIGN: Mastering creative techniques and tools
     """
     
+    __slots__ = ('skill_paths', 'practice_methods', 'feedback_systems')
+    
     def __init__(self):
         self.skill_paths = self._map_creative_skill_paths()
         self.practice_methods = self._develop_practice_techniques()
@@ -187,12 +198,12 @@ class CreativeSkillDeveloper:
             'creative_application': self._apply_skills_to_original_work(target_skills)
         }
         
-        return {
-            **skill_development_plan,
+        skill_development_plan.update({
             'learning_philosophy': 'Skill development is a creative act in itself',
             'plateau_navigation': 'Creative plateaus are opportunities for integration and growth',
             'enjoyment_focus': 'Find joy in the practice, not just the outcome'
-        }
+        })
+        return skill_development_plan
 
 # ==================== [MODULE: INNOVATION ENGINE] ====================
 # 💡 PURPOSE: Systematic innovation and problem-solving
@@ -204,6 +215,8 @@ class InnovationEngine:
     DESIGN: Applying creativity to problem-solving and invention
     """
     
+    __slots__ = ('innovation_methods', 'problem_reframing', 'prototype_thinking')
+    
     def __init__(self):
         self.innovation_methods = self._study_innovation_frameworks()
         self.problem_reframing = self._develop_reframing_techniques()
@@ -219,12 +232,12 @@ class InnovationEngine:
             'implementation_planning': self._create_rollout_strategies()
         }
         
-        return {
-            **innovation_process,
+        innovation_process.update({
             'innovation_mindset': 'Every problem contains the seeds of its own innovative solution',
             'iteration_philosophy': 'Innovation thrives through rapid learning cycles',
             'impact_focus': 'Measure success by real-world impact and user value'
-        }
+        })
+        return innovation_process
 
 # ==================== [MODULE: CREATIVE COMMUNITY] ====================
 # 👥 PURPOSE: Building creative networks and collaboration
@@ -236,6 +249,8 @@ class CreativeCommunityBuilder:
     DESIGN: Building supportive creative relationships
     """
     
+    __slots__ = ('community_strategies', 'collaboration_methods', 'feedback_culture')
+    
     def __init__(self):
         self.community_strategies = self._study_creative_communities()
         self.collaboration_methods = self._develop_collaboration_frameworks()
@@ -251,12 +266,12 @@ class CreativeCommunityBuilder:
             'contribution_planning': self._plan_community_contributions(creative_domain)
         }
         
-        return {
-            **network_plan,
+        network_plan.update({
             'community_philosophy': 'Creativity flourishes in communities of mutual support and inspiration',
             'reciprocity_mindset': 'The most vibrant creative networks give as much as they receive',
             'authenticity_emphasis': 'Genuine connections fuel meaningful creative partnerships'
-        }
+        })
+        return network_plan
 
 # ==================== [MODULE: PORTFOLIO DEVELOPMENT] ====================
 # 📁 PURPOSE: Building and showcasing creative work
@@ -268,6 +283,8 @@ class PortfolioDeveloper:
     DESIGN: Showcasing creative work effectively
     """
     
+    __slots__ = ('portfolio_strategies', 'storytelling_techniques', 'presentation_methods')
+    
     def __init__(self):
         self.portfolio_strategies = self._study_portfolio_best_practices()
         self.storytelling_techniques = self._develop_project_storytelling()
@@ -283,16 +300,20 @@ class PortfolioDeveloper:
             'promotion_strategies': self._develop_portfolio_promotion(target_audience)
         }
         
-        return {
-            **portfolio_plan,
+        portfolio_plan.update({
             'portfolio_philosophy': 'Your portfolio tells the story of your creative journey and vision',
             'authenticity_focus': 'Showcase work that represents your unique creative voice',
             'evolution_mindset': 'Your portfolio is a living document of your creative growth'
-        }
+        })
+        return portfolio_plan
 
 # ==================== [CREATIVITY COORDINATOR] ====================
 # 🎨 PURPOSE: Unified creative support management
 
+DAILY_SUPPORT_TTL = 12 * 60 * 60  # seconds - same-day repeats reuse the earlier support
+MAX_CACHED_DAILY_SUPPORT = 1024  # users whose latest daily support is kept
+MAX_ACTIVE_CREATIVE_PROFILES = 10000
+
 class CreativityEnhancementManager:
     """
     ENHANCEMENT 5: Comprehensive Creative Support System
@@ -301,17 +322,42 @@ class CreativityEnhancementManager:
     
     def __init__(self, intelligence_manager):
         self.intelligence_manager = intelligence_manager
-        self.mindset_coach = CreativeMindsetCoach()
-        self.idea_generator = IdeaGenerator()
-        self.block_buster = CreativeBlockBuster()
-        self.project_incubator = ProjectIncubator()
-        self.skill_developer = CreativeSkillDeveloper()
-        self.innovation_engine = InnovationEngine()
-        self.community_builder = CreativeCommunityBuilder()
-        self.portfolio_developer = PortfolioDeveloper()
-        
-        self.creative_profiles = {}  # user_id -> creative_profile
+        self.creative_profiles = LRUCache(MAX_ACTIVE_CREATIVE_PROFILES)  # user_id -> creative_profile
+        self._daily_cache = LRUCache(MAX_CACHED_DAILY_SUPPORT)  # user_id -> (context_key, stored_at, support)
         
+    # Submanagers are built on first use - most sessions only touch one or two
+    @cached_property
+    def mindset_coach(self):
+        return CreativeMindsetCoach()
+    
+    @cached_property
+    def idea_generator(self):
+        return IdeaGenerator()
+    
+    @cached_property
+    def block_buster(self):
+        return CreativeBlockBuster()
+    
+    @cached_property
+    def project_incubator(self):
+        return ProjectIncubator()
+    
+    @cached_property
+    def skill_developer(self):
+        return CreativeSkillDeveloper()
+    
+    @cached_property
+    def innovation_engine(self):
+        return InnovationEngine()
+    
+    @cached_property
+    def community_builder(self):
+        return CreativeCommunityBuilder()
+    
+    @cached_property
+    def portfolio_developer(self):
+        return PortfolioDeveloper()
+    
     def initialize_creative_journey(self, user_id, creative_domain, aspirations):
         """ENHANCEMENT 5.1: Start personalized creative development"""
         # Assess creative mindset and current state
@@ -332,6 +378,7 @@ class CreativityEnhancementManager:
         }
         
         self.creative_profiles[user_id] = creative_profile
+        self._daily_cache.pop(user_id, None)  # built from the profile being replaced
         
         # Generate integrated creative development plan
         development_plan = self._create_integrated_creative_plan(creative_domain, aspirations, mindset_assessment)
@@ -348,9 +395,19 @@ class CreativityEnhancementManager:
     def provide_daily_creative_support(self, user_id, daily_context):
         """ENHANCEMENT 5.2: Daily creative inspiration and guidance"""
         profile = self.creative_profiles.get(user_id)
-        if not profile:
+        if profile is None:
             return self._handle_new_creative_user(user_id)
         
+        try:
+            context_key = json.dumps(daily_context, default=str)
+        except (TypeError, ValueError):
+            context_key = None  # unserialisable context - build fresh and skip the cache
+        now = time.monotonic()
+        cached = self._daily_cache.get(user_id)
+        if (context_key is not None and cached is not None and cached[0] == context_key
+                and now - cached[1] < DAILY_SUPPORT_TTL):
+            return copy.deepcopy(cached[2])
+        
         daily_support = {
             'creative_warmup': self._suggest_daily_warmup(profile, daily_context),
             'inspiration_dose': self._provide_daily_inspiration(profile),
@@ -359,11 +416,15 @@ class CreativityEnhancementManager:
             'creative_reflection': self._facilitate_daily_creative_reflection(profile)
         }
         
-        return {
-            **daily_support,
+        daily_support.update({
             'creative_encouragement': self._get_daily_creative_motivation(profile),
             'progress_acknowledgment': self._celebrate_creative_wins(profile)
-        }
+        })
+        
+        if context_key is not None:
+            # Snapshot, so the caller may edit the support it receives
+            self._daily_cache[user_id] = (context_key, now, copy.deepcopy(daily_support))
+        return daily_support
     
     def handle_creative_crisis(self, user_id, crisis_type, emotional_state):
         """ENHANCEMENT 5.3: Emergency creative support"""
@@ -375,11 +436,11 @@ class CreativityEnhancementManager:
             'recovery_planning': self._create_creative_recovery_roadmap(user_id, crisis_type)
         }
         
-        return {
-            **crisis_support,
+        crisis_support.update({
             'crisis_reassurance': "Creative crises often precede major breakthroughs - trust the process 🌈",
             'hope_message': "Every creative has faced this moment - and emerged with renewed vision and strength 💪"
-        }
+        })
+        return crisis_support
 
 # ==================== [INTEGRATION FUNCTION] ====================
 
@@ -396,18 +457,12 @@ def initialize_creativity_enhancement(intelligence_manager):
 if __name__ == "__main__":
     print("🎨 ZaraAI Creativity Enhancement - TEST")
     
-    # Test creativity system
-    from intelligence_enhancement import IntelligenceEnhancementManager
-    from domain_foundations import DomainMasteryManager
-    from api_integration_manager import LightweightAPIManager
-    
-    api_mgr = LightweightAPIManager()
-    domain_mgr = DomainMasteryManager(api_mgr)
-    intel_mgr = IntelligenceEnhancementManager(domain_mgr)
-    creativity_mgr = initialize_creativity_enhancement(intel_mgr)
+    # Test creativity system - nothing here consults the intelligence manager,
+    # so the API/domain/intelligence stack is not bootstrapped for the demo
+    creativity_mgr = initialize_creativity_enhancement(None)
     
     # Test creative journey initialization
-    test_domain = 'WRITING'
+    test_domain = CreativeDomain.WRITING
     test_aspirations = {
         'complete_novel': True,
         'develop_writing_voice': True,
@@ -418,7 +473,7 @@ if __name__ == "__main__":
     journey = creativity_mgr.initialize_creative_journey('test_user', test_domain, test_aspirations)
     
     print(f"✅ Creativity System Active")
-    print(f"🎯 Creative Domain: {test_domain}")
+    print(f"🎯 Creative Domain: {test_domain.name}")
     print(f"📊 Mindset Score: {journey['mindset_assessment']['mindset_score']}/10")
     print(f"💡 Development Areas: {len(journey['development_plan'])}")
     print(f"✨ Support Style: {journey['support_commitment']}")
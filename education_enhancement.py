@@ -10,18 +10,17 @@ DEPENDENCIES: Built on existing ZaraAI phases
 # 🎯 PURPOSE: Intelligent curriculum and adaptive learning
 # ❤️ DESIGN: Compassionate teaching with proven pedagogical methods
 
-import re
-import json
-import time
-from datetime import datetime, timedelta
-from enum import Enum
-import math
+import bisect
+from enum import IntEnum
+from functools import cached_property
+from collections import deque
+from itertools import islice
 
 # ==================== [MODULE: LEARNING STYLE DETECTION] ====================
 # 🧠 PURPOSE: Identify how each user learns best
 # 🔬 SCIENCE: VARK model + multiple intelligence theory
 
-class LearningStyle(Enum):
+class LearningStyle(IntEnum):
     VISUAL = 1      # Learns through images, diagrams, videos
     AUDITORY = 2    # Learns through listening, discussions
     READING = 3     # Learns through reading, writing
@@ -34,6 +33,10 @@ class LearningStyleDetector:
     DESIGN: Continuous assessment through interaction patterns
     """
     
+    SCORED_STYLES = (LearningStyle.VISUAL, LearningStyle.AUDITORY, LearningStyle.READING, LearningStyle.KINESTHETIC)
+    
+    __slots__ = ('assessment_questions', 'interaction_patterns')
+    
     def __init__(self):
         self.assessment_questions = self._create_style_assessment()
         self.interaction_patterns = self._initialize_patterns()
@@ -56,24 +59,22 @@ class LearningStyleDetector:
     
     def _infer_from_interactions(self, interactions):
         """PHASE 1A.2: Infer learning style from user behavior"""
-        style_scores = {
-            LearningStyle.VISUAL: 0,
-            LearningStyle.AUDITORY: 0,
-            LearningStyle.READING: 0,
-            LearningStyle.KINESTHETIC: 0
-        }
+        visual = auditory = reading = kinesthetic = 0
         
-        for interaction in interactions[-50:]:  # Last 50 interactions
+        # Last 50 interactions - islice, since learning_history is a deque and cannot be sliced
+        for interaction in islice(interactions, max(len(interactions) - 50, 0), None):
             if interaction.get('prefers_visuals'):
-                style_scores[LearningStyle.VISUAL] += 2
+                visual += 2
             if interaction.get('asks_for_examples'):
-                style_scores[LearningStyle.KINESTHETIC] += 1.5
+                kinesthetic += 1.5
             if interaction.get('enjoys_discussions'):
-                style_scores[LearningStyle.AUDITORY] += 1.5
+                auditory += 1.5
             if interaction.get('reads_carefully'):
-                style_scores[LearningStyle.READING] += 2
+                reading += 2
         
-        return max(style_scores, key=style_scores.get)
+        # First highest score wins, in SCORED_STYLES order
+        style_scores = (visual, auditory, reading, kinesthetic)
+        return self.SCORED_STYLES[style_scores.index(max(style_scores))]
 
 # ==================== [MODULE: ADAPTIVE CURRICULUM] ====================
 # 📚 PURPOSE: Dynamic learning path creation
@@ -85,6 +86,8 @@ class AdaptiveCurriculumEngine:
     DESIGN: Creates personalized learning journeys
     """
     
+    __slots__ = ('domain_knowledge_graphs', 'learning_objectives')
+    
     def __init__(self):
         self.domain_knowledge_graphs = self._build_knowledge_graphs()
         self.learning_objectives = self._define_learning_objectives()
@@ -109,14 +112,13 @@ class AdaptiveCurriculumEngine:
     def _create_learning_units(self, target_skill, current_level, user_profile):
         """PHASE 1B.2: Create personalized learning content"""
         base_units = self._get_standard_curriculum(target_skill)
-        personalized_units = []
+        adapt_unit = self._adapt_unit_to_learner
         
-        for unit in base_units:
-            if unit['difficulty_level'] >= current_level:
-                adapted_unit = self._adapt_unit_to_learner(unit, user_profile)
-                personalized_units.append(adapted_unit)
-        
-        return personalized_units
+        return [
+            adapt_unit(unit, user_profile)
+            for unit in base_units
+            if unit['difficulty_level'] >= current_level
+        ]
     
     def _adapt_unit_to_learner(self, unit, user_profile):
         """PHASE 1B.3: Adapt content to learning style and preferences"""
@@ -142,6 +144,16 @@ class MicrolearningEngine:
     DESIGN: Optimized for attention spans and busy schedules
     """
     
+    ENGAGEMENT_HOOKS = {
+        LearningStyle.VISUAL: "Show surprising visual about {concept}",
+        LearningStyle.AUDITORY: "Start with thought-provoking question about {concept}",
+        LearningStyle.READING: "Present intriguing paradox about {concept}",
+        LearningStyle.KINESTHETIC: "Quick hands-on demo related to {concept}"
+    }
+    DEFAULT_HOOK = "Let's explore {concept} together"
+    
+    __slots__ = ('microlearning_templates', 'attention_tracker')
+    
     def __init__(self):
         self.microlearning_templates = self._create_templates()
         self.attention_tracker = AttentionTracker()
@@ -166,13 +178,7 @@ class MicrolearningEngine:
     
     def _create_engagement_hook(self, concept, learning_style):
         """PHASE 1C.2: Create compelling lesson introduction"""
-        hooks = {
-            LearningStyle.VISUAL: f"Show surprising visual about {concept}",
-            LearningStyle.AUDITORY: f"Start with thought-provoking question about {concept}",
-            LearningStyle.READING: f"Present intriguing paradox about {concept}",
-            LearningStyle.KINESTHETIC: f"Quick hands-on demo related to {concept}"
-        }
-        return hooks.get(learning_style, f"Let's explore {concept} together")
+        return self.ENGAGEMENT_HOOKS.get(learning_style, self.DEFAULT_HOOK).format(concept=concept)
 
 # ==================== [MODULE: EMOTIONAL LEARNING SUPPORT] ====================
 # ❤️ PURPOSE: Learning-specific emotional intelligence
@@ -184,6 +190,28 @@ class EmotionalLearningSupport:
     DESIGN: Neuroscience-backed learning encouragement
     """
     
+    # Phrase tiers for struggle_level <= 0.4, <= 0.7 and above
+    STRUGGLE_THRESHOLDS = (0.4, 0.7)
+    ENCOURAGEMENT_TIERS = (
+        (
+            "You're making excellent progress! 🌟",
+            "Your understanding is really deepening! 💪",
+            "I can see your skills growing with each session! 🚀"
+        ),
+        (
+            "This challenge is helping your brain grow stronger! 🌱",
+            "Struggle means you're at the edge of your learning - that's where growth happens! 📈",
+            "You're building resilience along with knowledge! 🛡️"
+        ),
+        (
+            "I'm here with you through this challenge 💖",
+            "Every expert was once a beginner who didn't give up 🏆",
+            "Let's break this down together - you can do this! 🤝"
+        )
+    )
+    
+    __slots__ = ('learning_anxiety_triggers', 'growth_mindset_phrases', 'micro_celebration_system')
+    
     def __init__(self):
         self.learning_anxiety_triggers = self._identify_anxiety_triggers()
         self.growth_mindset_phrases = self._create_encouragement_library()
@@ -191,14 +219,19 @@ class EmotionalLearningSupport:
         
     def detect_learning_anxiety(self, user_input, performance_data):
         """PHASE 1D.1: Identify learning-related stress signals"""
+        perfectionism = self._detect_perfectionism(user_input)
+        frustration = self._assess_frustration(performance_data)
+        confidence_dips = self._track_confidence_changes(performance_data)
+        avoidance = self._detect_avoidance_patterns(user_input)
+        
         anxiety_indicators = {
-            'perfectionism_signals': self._detect_perfectionism(user_input),
-            'frustration_level': self._assess_frustration(performance_data),
-            'confidence_dips': self._track_confidence_changes(performance_data),
-            'avoidance_behaviors': self._detect_avoidance_patterns(user_input)
+            'perfectionism_signals': perfectionism,
+            'frustration_level': frustration,
+            'confidence_dips': confidence_dips,
+            'avoidance_behaviors': avoidance
         }
         
-        anxiety_score = sum(anxiety_indicators.values()) / len(anxiety_indicators)
+        anxiety_score = (perfectionism + frustration + confidence_dips + avoidance) / 4
         
         return {
             'anxiety_level': anxiety_score,
@@ -209,26 +242,8 @@ class EmotionalLearningSupport:
     
     def provide_learning_encouragement(self, milestone, struggle_level):
         """PHASE 1D.2: Growth mindset-based encouragement"""
-        encouragement_tiers = {
-            'low_struggle': [
-                "You're making excellent progress! 🌟",
-                "Your understanding is really deepening! 💪",
-                "I can see your skills growing with each session! 🚀"
-            ],
-            'medium_struggle': [
-                "This challenge is helping your brain grow stronger! 🌱",
-                "Struggle means you're at the edge of your learning - that's where growth happens! 📈",
-                "You're building resilience along with knowledge! 🛡️"
-            ],
-            'high_struggle': [
-                "I'm here with you through this challenge 💖",
-                "Every expert was once a beginner who didn't give up 🏆",
-                "Let's break this down together - you can do this! 🤝"
-            ]
-        }
-        
-        tier = 'high_struggle' if struggle_level > 0.7 else 'medium_struggle' if struggle_level > 0.4 else 'low_struggle'
-        return encouragement_tiers[tier][milestone % len(encouragement_tiers[tier])]
+        phrases = self.ENCOURAGEMENT_TIERS[bisect.bisect_left(self.STRUGGLE_THRESHOLDS, struggle_level)]
+        return phrases[milestone % len(phrases)]
 
 # ==================== [MODULE: KNOWLEDGE ASSESSMENT] ====================
 # 📊 PURPOSE: Continuous skill measurement
@@ -240,6 +255,8 @@ class KnowledgeAssessmentEngine:
     DESIGN: Real-time skill tracking with compassionate feedback
     """
     
+    __slots__ = ('assessment_types', 'feedback_templates')
+    
     def __init__(self):
         self.assessment_types = self._define_assessment_methods()
         self.feedback_templates = self._create_feedback_templates()
@@ -286,14 +303,18 @@ class RealWorldApplicationEngine:
     DESIGN: Bridge between theory and real-world use
     """
     
+    __slots__ = ('project_templates', 'industry_connections')
+    
     def __init__(self):
         self.project_templates = self._create_project_templates()
         self.industry_connections = self._map_to_industry_needs()
         
     def create_mini_project(self, concept, skill_level, interests):
         """PHASE 1F.1: Create relevant practical project"""
+        focus = interests[0] if interests else 'your goals'
+        
         project = {
-            'title': f"Apply {concept} to {interests[0]}",
+            'title': f"Apply {concept} to {focus}",
             'duration': '1-3 hours',
             'learning_objectives': [f"Practical application of {concept}"],
             'materials_needed': 'Basic computer/phone',
@@ -307,6 +328,8 @@ class RealWorldApplicationEngine:
 # ==================== [EDUCATION COORDINATOR] ====================
 # 🎓 PURPOSE: Unified educational experience management
 
+LEARNING_HISTORY_LIMIT = 500  # most recent history entries kept per learner
+
 class EducationEnhancementManager:
     """
     PHASE 1: Comprehensive Educational Transformation System
@@ -315,15 +338,33 @@ class EducationEnhancementManager:
     
     def __init__(self, intelligence_manager):
         self.intelligence_manager = intelligence_manager
-        self.style_detector = LearningStyleDetector()
-        self.curriculum_engine = AdaptiveCurriculumEngine()
-        self.microlearning_engine = MicrolearningEngine()
-        self.emotional_support = EmotionalLearningSupport()
-        self.assessment_engine = KnowledgeAssessmentEngine()
-        self.application_engine = RealWorldApplicationEngine()
-        
         self.learner_profiles = {}  # user_id -> learning_profile
         
+    # Engines are built on first use - a journey start only needs three of them
+    @cached_property
+    def style_detector(self):
+        return LearningStyleDetector()
+    
+    @cached_property
+    def curriculum_engine(self):
+        return AdaptiveCurriculumEngine()
+    
+    @cached_property
+    def microlearning_engine(self):
+        return MicrolearningEngine()
+    
+    @cached_property
+    def emotional_support(self):
+        return EmotionalLearningSupport()
+    
+    @cached_property
+    def assessment_engine(self):
+        return KnowledgeAssessmentEngine()
+    
+    @cached_property
+    def application_engine(self):
+        return RealWorldApplicationEngine()
+    
     def initialize_learning_journey(self, user_id, learning_goals):
         """PHASE 1.1: Start personalized educational experience"""
         # Detect learning style through initial interaction
@@ -336,7 +377,7 @@ class EducationEnhancementManager:
             'preferred_pace': 'moderate',
             'confidence_level': 0.7,
             'interests': self._discover_interests(learning_goals),
-            'learning_history': []
+            'learning_history': deque(maxlen=LEARNING_HISTORY_LIMIT)
         }
         
         self.learner_profiles[user_id] = learner_profile
@@ -361,7 +402,7 @@ class EducationEnhancementManager:
     def conduct_learning_session(self, user_id, concept_focus=None):
         """PHASE 1.2: Deliver personalized learning experience"""
         profile = self.learner_profiles.get(user_id)
-        if not profile:
+        if profile is None:
             return self._handle_new_learner(user_id)
         
         # Select concept based on learning path or user request
@@ -385,12 +426,15 @@ class EducationEnhancementManager:
     def assess_progress(self, user_id, concept, responses):
         """PHASE 1.3: Evaluate learning with compassionate feedback"""
         profile = self.learner_profiles.get(user_id)
+        if profile is None:
+            return self._handle_new_learner(user_id)
+        assessment_engine = self.assessment_engine
         
         # Conduct assessment
-        performance = self.assessment_engine.conduct_formative_assessment(concept, profile)
+        performance = assessment_engine.conduct_formative_assessment(concept, profile)
         
         # Provide supportive feedback
-        feedback = self.assessment_engine.provide_compassionate_feedback(
+        feedback = assessment_engine.provide_compassionate_feedback(
             {'responses': responses, 'concept': concept},
             profile['learning_style']['primary_style']
         )
@@ -10,13 +10,9 @@ DEPENDENCIES: Built on existing ZaraAI phases
 # 💰 PURPOSE: Comprehensive financial health and wealth building
 # 🛡️ DESIGN: Safe financial guidance with emotional support
 
-import re
-import json
-import time
-from datetime import datetime, timedelta
 from enum import Enum
-from collections import defaultdict
-import math
+from collections import deque
+from functools import cached_property
 
 # ==================== [MODULE: FINANCIAL HEALTH ASSESSMENT] ====================
 # 📊 PURPOSE: Comprehensive financial situation analysis
@@ -29,6 +25,13 @@ class FinancialHealthLevel(Enum):
     COMFORTABLE = 4     # Emergency fund, some investments
     THRIVING = 5        # Strong savings, diversified investments
 
+# Encouragement by health score bucket: < 3, < 7, otherwise
+_FINANCIAL_ENCOURAGEMENT = (
+    "Financial journeys start with awareness - you're taking the first brave step! 🌱",
+    "Every small financial improvement creates lasting security. You're building momentum! 💪",
+    "Your financial mindfulness is creating a foundation of security and freedom! 🏰",
+)
+
 class FinancialHealthAssessor:
     """
     ENHANCEMENT 3A: AI-Powered Financial Health Analysis
@@ -62,12 +65,7 @@ class FinancialHealthAssessor:
     
     def _get_financial_encouragement(self, health_score):
         """ENHANCEMENT 3A.2: Compassionate financial encouragement"""
-        if health_score < 3:
-            return "Financial journeys start with awareness - you're taking the first brave step! 🌱"
-        elif health_score < 7:
-            return "Every small financial improvement creates lasting security. You're building momentum! 💪"
-        else:
-            return "Your financial mindfulness is creating a foundation of security and freedom! 🏰"
+        return _FINANCIAL_ENCOURAGEMENT[0 if health_score < 3 else 1 if health_score < 7 else 2]
 
 # ==================== [MODULE: BUDGET OPTIMIZATION] ====================
 # 📈 PURPOSE: Smart budgeting and expense management
@@ -305,6 +303,8 @@ class FinancialPsychologyCoach:
 # ==================== [FINANCIAL COORDINATOR] ====================
 # 💰 PURPOSE: Unified financial wellness management
 
+MILESTONE_HISTORY_MONTHS = 120  # ten years of monthly milestones kept per user
+
 class FinancialEnhancementManager:
     """
     ENHANCEMENT 3: Comprehensive Financial Wellness System
@@ -313,17 +313,41 @@ class FinancialEnhancementManager:
     
     def __init__(self, intelligence_manager):
         self.intelligence_manager = intelligence_manager
-        self.health_assessor = FinancialHealthAssessor()
-        self.budget_optimizer = BudgetOptimizer()
-        self.debt_manager = DebtManagement()
-        self.investment_strategist = InvestmentStrategist()
-        self.retirement_planner = RetirementPlanner()
-        self.goal_tracker = FinancialGoalTracker()
-        self.tax_optimizer = TaxOptimization()
-        self.psychology_coach = FinancialPsychologyCoach()
-        
         self.financial_profiles = {}  # user_id -> financial_profile
         
+    # Submanagers are built on first use - onboarding only needs the health assessor
+    @cached_property
+    def health_assessor(self):
+        return FinancialHealthAssessor()
+    
+    @cached_property
+    def budget_optimizer(self):
+        return BudgetOptimizer()
+    
+    @cached_property
+    def debt_manager(self):
+        return DebtManagement()
+    
+    @cached_property
+    def investment_strategist(self):
+        return InvestmentStrategist()
+    
+    @cached_property
+    def retirement_planner(self):
+        return RetirementPlanner()
+    
+    @cached_property
+    def goal_tracker(self):
+        return FinancialGoalTracker()
+    
+    @cached_property
+    def tax_optimizer(self):
+        return TaxOptimization()
+    
+    @cached_property
+    def psychology_coach(self):
+        return FinancialPsychologyCoach()
+    
     def initialize_financial_journey(self, user_id, financial_goals, current_finances):
         """ENHANCEMENT 3.1: Start personalized financial wellness journey"""
         # Conduct comprehensive financial assessment
@@ -336,7 +360,7 @@ class FinancialEnhancementManager:
             'current_finances': current_finances,
             'financial_goals': financial_goals,
             'health_assessment': financial_assessment,
-            'progress_milestones': [],
+            'progress_milestones': deque(maxlen=MILESTONE_HISTORY_MONTHS),
             'behavioral_patterns': {}
         }
         
@@ -401,7 +425,8 @@ def initialize_financial_enhancement(intelligence_manager):
 # 💰 MILESTONE: Financial Enhancement Ready
 # 🛡️ DESIGN: Safe, compassionate financial guidance
 
-if __name__ == "__main__":
+def _smoke_test():
+    """Manual smoke test - heavy sibling modules are only imported here"""
     print("💰 ZaraAI Financial Enhancement - TEST")
     
     # Test financial system
@@ -435,3 +460,6 @@ if __name__ == "__main__":
     print(f"🎯 Priority Actions: {len(journey['financial_assessment']['priority_actions'])}")
     print(f"💫 Support Style: {journey['support_commitment']}")
     print("🛡️ Ready to build financial security and freedom!")
+
+if __name__ == "__main__":
+    _smoke_test()
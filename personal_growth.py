@@ -10,18 +10,14 @@ DEPENDENCIES: Built on existing ZaraAI phases
 # 🌱 PURPOSE: Comprehensive personal growth and life transformation
 # 🦋 DESIGN: Holistic development with compassionate support
 
-import re
-import json
-import time
-from datetime import datetime, timedelta
-from enum import Enum
-from collections import defaultdict
+from enum import IntEnum
+from functools import cached_property
 
 # ==================== [MODULE: LIFE VISION] ====================
 # 🎯 PURPOSE: Creating compelling life vision and purpose
 # 🌟 DESIGN: Values-based life design
 
-class LifeDomain(Enum):
+class LifeDomain(IntEnum):
     CAREER = 1           # Professional life and work
     RELATIONSHIPS = 2    # Personal connections
     HEALTH = 3           # Physical and mental wellbeing
@@ -31,6 +27,13 @@ class LifeDomain(Enum):
     SPIRITUALITY = 7     # Meaning and connection
     LIFESTYLE = 8        # Daily living and environment
 
+# Encouragement by alignment score bucket: < 4, < 7, otherwise
+_VISION_ENCOURAGEMENT = (
+    "Creating your vision is the first courageous step toward designing the life you truly desire! 🌟",
+    "Your vision is taking shape beautifully! Each insight brings you closer to your ideal life 💫",
+    "Your vision is clear and compelling! You're designing a life of purpose and fulfillment 🎯",
+)
+
 class LifeVisionDesigner:
     """
     ENHANCEMENT 7A: Comprehensive Life Vision Creation
@@ -62,12 +65,7 @@ class LifeVisionDesigner:
     def _get_vision_encouragement(self, vision_development):
         """ENHANCEMENT 7A.2: Inspiring vision encouragement"""
         alignment = vision_development['alignment_analysis']['alignment_score']
-        if alignment < 4:
-            return "Creating your vision is the first courageous step toward designing the life you truly desire! 🌟"
-        elif alignment < 7:
-            return "Your vision is taking shape beautifully! Each insight brings you closer to your ideal life 💫"
-        else:
-            return "Your vision is clear and compelling! You're designing a life of purpose and fulfillment 🎯"
+        return _VISION_ENCOURAGEMENT[0 if alignment < 4 else 1 if alignment < 7 else 2]
 
 # ==================== [MODULE: MINDSET MASTERY] ====================
 # 🧠 PURPOSE: Transforming limiting beliefs and patterns
@@ -258,7 +256,7 @@ class TransformationTracker:
             **tracking_system,
             'tracking_philosophy': 'What gets measured gets improved - and celebrated!',
             'process_focus': 'Focus on the journey of growth, not just the destination',
-            'compassionate_measurement': 'Progress isn't always linear - honor your unique growth path'
+            'compassionate_measurement': "Progress isn't always linear - honor your unique growth path"
         }
 
 # ==================== [MODULE: LIFE INTEGRATION] ====================
@@ -304,17 +302,41 @@ class TransformationEnhancementManager:
     
     def __init__(self, intelligence_manager):
         self.intelligence_manager = intelligence_manager
-        self.vision_designer = LifeVisionDesigner()
-        self.mindset_coach = MindsetMasteryCoach()
-        self.habit_architect = HabitArchitect()
-        self.awareness_guide = SelfAwarenessGuide()
-        self.resilience_builder = ResilienceBuilder()
-        self.purpose_guide = PurposeLivingGuide()
-        self.transformation_tracker = TransformationTracker()
-        self.integration_coach = LifeIntegrationCoach()
-        
         self.transformation_profiles = {}  # user_id -> transformation_profile
         
+    # Coaches are built on first use - each one loads its own frameworks
+    @cached_property
+    def vision_designer(self):
+        return LifeVisionDesigner()
+    
+    @cached_property
+    def mindset_coach(self):
+        return MindsetMasteryCoach()
+    
+    @cached_property
+    def habit_architect(self):
+        return HabitArchitect()
+    
+    @cached_property
+    def awareness_guide(self):
+        return SelfAwarenessGuide()
+    
+    @cached_property
+    def resilience_builder(self):
+        return ResilienceBuilder()
+    
+    @cached_property
+    def purpose_guide(self):
+        return PurposeLivingGuide()
+    
+    @cached_property
+    def transformation_tracker(self):
+        return TransformationTracker()
+    
+    @cached_property
+    def integration_coach(self):
+        return LifeIntegrationCoach()
+    
     def initialize_transformation_journey(self, user_id, current_life, transformation_goals):
         """ENHANCEMENT 7.1: Start personalized transformation journey"""
         # Create comprehensive life vision